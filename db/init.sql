@@ -1,28 +1,38 @@
 -- Shipping Service Database Schema
 
+-- Enum types (shared by shipments and shipment_events)
+CREATE TYPE shipment_status AS ENUM (
+    'PENDING', 'PACKED', 'SHIPPED', 'IN_TRANSIT',
+    'OUT_FOR_DELIVERY', 'DELIVERED', 'FAILED', 'CANCELLED'
+);
+CREATE TYPE shipment_carrier AS ENUM ('DHL', 'Bluedart', 'FedEx', 'DTDC');
+
 CREATE TABLE IF NOT EXISTS shipments (
     shipment_id SERIAL PRIMARY KEY,
     order_id INT NOT NULL UNIQUE,
-    carrier VARCHAR(50) NOT NULL,
-    status VARCHAR(50) NOT NULL,
-    tracking_no VARCHAR(50) UNIQUE NOT NULL,
+    carrier shipment_carrier NOT NULL,
+    status shipment_status NOT NULL,
+    tracking_no VARCHAR(50) UNIQUE NOT NULL DEFAULT ('TRK' || upper(substr(replace(gen_random_uuid()::text, '-', ''), 1, 12))),
     shipped_at TIMESTAMP NULL,
     delivered_at TIMESTAMP NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
+    updated_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')
 );
 
 CREATE INDEX idx_shipments_order_id ON shipments(order_id);
-CREATE INDEX idx_shipments_status ON shipments(status);
 CREATE INDEX idx_shipments_tracking_no ON shipments(tracking_no);
+CREATE INDEX idx_shipments_status_carrier_id ON shipments(status, carrier, shipment_id DESC)
+    INCLUDE (order_id, tracking_no, shipped_at, delivered_at, created_at, updated_at);
+CREATE INDEX idx_shipments_status_id ON shipments(status, shipment_id DESC);
+CREATE INDEX idx_shipments_carrier_id ON shipments(carrier, shipment_id DESC);
 
 CREATE TABLE IF NOT EXISTS shipment_events (
     event_id SERIAL PRIMARY KEY,
-    shipment_id INT NOT NULL,
-    status VARCHAR(50) NOT NULL,
+    shipment_id INT NOT NULL REFERENCES shipments(shipment_id) ON DELETE CASCADE,
+    status shipment_status NOT NULL,
     location VARCHAR(200),
     description VARCHAR(500),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC')
 );
 
 CREATE INDEX idx_shipment_events_shipment_id ON shipment_events(shipment_id);
@@ -33,7 +43,7 @@ CREATE TABLE IF NOT EXISTS idempotency_keys (
     key VARCHAR(255) UNIQUE NOT NULL,
     request_hash VARCHAR(64) NOT NULL,
     response_data VARCHAR(2000) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
     expires_at TIMESTAMP NOT NULL
 );
 
@@ -4,6 +4,15 @@
 DROP TABLE IF EXISTS shipment_events CASCADE;
 DROP TABLE IF EXISTS shipments CASCADE;
 DROP TABLE IF EXISTS idempotency_keys CASCADE;
+DROP TYPE IF EXISTS shipment_status;
+DROP TYPE IF EXISTS shipment_carrier;
+
+-- Create enum types (shared by shipments and shipment_events)
+CREATE TYPE shipment_status AS ENUM (
+    'PENDING', 'PACKED', 'SHIPPED', 'IN_TRANSIT',
+    'OUT_FOR_DELIVERY', 'DELIVERED', 'FAILED', 'CANCELLED'
+);
+CREATE TYPE shipment_carrier AS ENUM ('DHL', 'Bluedart', 'FedEx', 'DTDC');
 
 -- Create idempotency_keys table
 CREATE TABLE idempotency_keys (
@@ -11,7 +20,7 @@ CREATE TABLE idempotency_keys (
     key VARCHAR(255) UNIQUE NOT NULL,
     request_hash VARCHAR(64) NOT NULL,
     response_data VARCHAR(2000) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
     expires_at TIMESTAMP NOT NULL
 );
 
@@ -23,20 +32,15 @@ CREATE INDEX idx_idempotency_expires_at ON idempotency_keys(expires_at);
 CREATE TABLE shipments (
     shipment_id SERIAL PRIMARY KEY,
     order_id INT NOT NULL UNIQUE,
-    carrier VARCHAR(50) NOT NULL,
-    status VARCHAR(50) NOT NULL DEFAULT 'PENDING',
-    tracking_no VARCHAR(50) UNIQUE NOT NULL,
+    carrier shipment_carrier NOT NULL,
+    status shipment_status NOT NULL DEFAULT 'PENDING',
+    tracking_no VARCHAR(50) UNIQUE NOT NULL DEFAULT ('TRK' || upper(substr(replace(gen_random_uuid()::text, '-', ''), 1, 12))),
     shipped_at TIMESTAMP NULL,
     delivered_at TIMESTAMP NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
+    updated_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
     
     -- Constraints
-    CONSTRAINT chk_status CHECK (status IN (
-        'PENDING', 'PACKED', 'SHIPPED', 'IN_TRANSIT', 
-        'OUT_FOR_DELIVERY', 'DELIVERED', 'FAILED', 'CANCELLED'
-    )),
-    CONSTRAINT chk_carrier CHECK (carrier IN ('DHL', 'Bluedart', 'FedEx', 'DTDC')),
     CONSTRAINT chk_shipped_at CHECK (shipped_at IS NULL OR shipped_at >= created_at),
     CONSTRAINT chk_delivered_at CHECK (delivered_at IS NULL OR delivered_at >= created_at)
 );
@@ -45,26 +49,24 @@ CREATE TABLE shipments (
 CREATE TABLE shipment_events (
     event_id SERIAL PRIMARY KEY,
     shipment_id INT NOT NULL,
-    status VARCHAR(50) NOT NULL,
+    status shipment_status NOT NULL,
     location VARCHAR(200),
     description VARCHAR(500),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'UTC'),
     
     -- Constraints
     CONSTRAINT fk_shipment FOREIGN KEY (shipment_id) 
-        REFERENCES shipments(shipment_id) ON DELETE CASCADE,
-    CONSTRAINT chk_event_status CHECK (status IN (
-        'PENDING', 'PACKED', 'SHIPPED', 'IN_TRANSIT', 
-        'OUT_FOR_DELIVERY', 'DELIVERED', 'FAILED', 'CANCELLED'
-    ))
+        REFERENCES shipments(shipment_id) ON DELETE CASCADE
 );
 
 -- Create indexes for better query performance
 CREATE INDEX idx_shipments_order_id ON shipments(order_id);
 CREATE INDEX idx_shipments_tracking_no ON shipments(tracking_no);
-CREATE INDEX idx_shipments_status ON shipments(status);
-CREATE INDEX idx_shipments_carrier ON shipments(carrier);
 CREATE INDEX idx_shipments_created_at ON shipments(created_at);
+CREATE INDEX idx_shipments_status_carrier_id ON shipments(status, carrier, shipment_id DESC)
+    INCLUDE (order_id, tracking_no, shipped_at, delivered_at, created_at, updated_at);
+CREATE INDEX idx_shipments_status_id ON shipments(status, shipment_id DESC);
+CREATE INDEX idx_shipments_carrier_id ON shipments(carrier, shipment_id DESC);
 CREATE INDEX idx_shipment_events_shipment_id ON shipment_events(shipment_id);
 CREATE INDEX idx_shipment_events_status ON shipment_events(status);
 CREATE INDEX idx_shipment_events_created_at ON shipment_events(created_at);
@@ -73,7 +75,7 @@ CREATE INDEX idx_shipment_events_created_at ON shipment_events(created_at);
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = CURRENT_TIMESTAMP;
+    NEW.updated_at = CURRENT_TIMESTAMP AT TIME ZONE 'UTC';
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Replace the module's Redis client with one on an in-memory fakeredis server"""
+    fakeredis = pytest.importorskip("fakeredis")
+    import fakeredis.aioredis
+    import main
+
+    server = fakeredis.FakeServer()
+    client = fakeredis.aioredis.FakeRedis(server=server)
+    monkeypatch.setattr(main, "redis_client", client)
+    return server, client
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    """Stands in for an AsyncSession, answering every execute with the same rows"""
+
+    def __init__(self):
+        self.rows = []
+        self.statements = []
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+        return FakeResult(self.rows)
+
+
+@pytest.fixture
+def fake_db():
+    """Serve the get_db dependency from a FakeSession"""
+    import main
+
+    session = FakeSession()
+
+    async def get_fake_db():
+        yield session
+
+    main.app.dependency_overrides[main.get_db] = get_fake_db
+    yield session
+    main.app.dependency_overrides.pop(main.get_db, None)
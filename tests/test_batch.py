@@ -0,0 +1,31 @@
+"""
+Batch create validation. Requests are rejected before any database access,
+so these run without PostgreSQL.
+"""
+from fastapi.testclient import TestClient
+
+import main
+
+
+def post_batch(items):
+    with TestClient(main.app) as client:
+        return client.post("/v1/shipments:batch", json=items)
+
+
+def test_empty_batch_is_rejected():
+    response = post_batch([])
+    assert response.status_code == 400
+    assert response.json()["message"] == "At least one shipment is required"
+
+
+def test_oversized_batch_is_rejected(monkeypatch):
+    monkeypatch.setattr(main, "MAX_BATCH_SIZE", 2)
+    response = post_batch([{"order_id": order_id} for order_id in (1, 2, 3)])
+    assert response.status_code == 400
+    assert response.json()["message"] == "Batch size 3 exceeds the maximum of 2"
+
+
+def test_duplicate_order_in_batch_is_rejected():
+    response = post_batch([{"order_id": 1}, {"order_id": 2}, {"order_id": 1}])
+    assert response.status_code == 400
+    assert response.json()["message"] == "Duplicate order_id in batch"
@@ -0,0 +1,93 @@
+"""
+Read-through cache (cached_read) tests against fakeredis.
+"""
+import asyncio
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def short_lock_wait(monkeypatch):
+    monkeypatch.setattr(main, "CACHE_LOCK_WAIT_SECONDS", 0.01)
+
+
+def counting_loader(value):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return value
+    return loader, calls
+
+
+def test_miss_runs_loader_once_and_fills_cache(fake_redis):
+    _, client = fake_redis
+    loader, calls = counting_loader({"shipment_id": 1})
+
+    async def scenario():
+        first = await main.cached_read("ship:id:1", 30, loader)
+        second = await main.cached_read("ship:id:1", 30, loader)
+        return first, second, await client.exists("ship:id:1:lock")
+
+    first, second, lock_left = asyncio.run(scenario())
+    assert first == second == {"shipment_id": 1}
+    assert len(calls) == 1
+    assert not lock_left
+
+
+def test_none_is_not_cached(fake_redis):
+    loader, calls = counting_loader(None)
+
+    async def scenario():
+        await main.cached_read("ship:id:404", 30, loader)
+        await main.cached_read("ship:id:404", 30, loader)
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_waiter_reads_value_filled_by_lock_holder(fake_redis):
+    _, client = fake_redis
+    loader, calls = counting_loader({"shipment_id": "from-db"})
+
+    async def scenario():
+        await client.set("ship:id:2:lock", 1)
+
+        async def holder_fills_cache():
+            await asyncio.sleep(0.02)
+            await main.cache_set("ship:id:2", {"shipment_id": "from-holder"}, 30)
+
+        filler = asyncio.create_task(holder_fills_cache())
+        value = await main.cached_read("ship:id:2", 30, loader)
+        await filler
+        return value
+
+    assert asyncio.run(scenario()) == {"shipment_id": "from-holder"}
+    assert not calls
+
+
+def test_waiter_falls_back_to_loader_and_keeps_foreign_lock(fake_redis):
+    _, client = fake_redis
+    loader, calls = counting_loader({"shipment_id": 3})
+
+    async def scenario():
+        await client.set("ship:id:3:lock", 1)
+        value = await main.cached_read("ship:id:3", 30, loader)
+        return value, await client.exists("ship:id:3:lock")
+
+    value, lock_left = asyncio.run(scenario())
+    assert value == {"shipment_id": 3}
+    assert len(calls) == 1
+    # The lock belongs to the other caller and is left for it to release
+    assert lock_left
+
+
+def test_redis_unavailable_reads_loader(fake_redis):
+    server, _ = fake_redis
+    server.connected = False
+    loader, calls = counting_loader({"shipment_id": 4})
+
+    assert asyncio.run(main.cached_read("ship:id:4", 30, loader)) == {"shipment_id": 4}
+    assert len(calls) == 1
@@ -0,0 +1,67 @@
+"""
+Server-Sent Events stream tests. The shipment is served from the (fakeredis)
+cache, so no database is needed.
+"""
+import asyncio
+
+import orjson
+
+import main
+
+
+def cached_shipment(shipment_id, status):
+    return {
+        "shipment_id": shipment_id,
+        "order_id": 500 + shipment_id,
+        "carrier": "DHL",
+        "status": status,
+        "tracking_no": f"TRK{shipment_id:012X}",
+        "shipped_at": None,
+        "delivered_at": None,
+        "created_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00"
+    }
+
+
+async def open_stream(shipment_id, status):
+    shipment = cached_shipment(shipment_id, status)
+    await main.cache_set(f"ship:id:{shipment_id}", shipment, 30)
+    response = await main.stream_shipment_events(shipment_id)
+    return shipment, response.body_iterator
+
+
+async def data_frames(frames):
+    """Collect the remaining frames, minus keepalive comments (which may come at any time)"""
+    return [frame async for frame in frames if not frame.startswith(b":")]
+
+
+def test_terminal_shipment_sends_initial_frame_and_ends(fake_redis):
+    async def scenario():
+        shipment, frames = await open_stream(1, "DELIVERED")
+        return shipment, await data_frames(frames)
+
+    shipment, frames = asyncio.run(scenario())
+    assert frames == [b"event: shipment\ndata: " + orjson.dumps(shipment) + b"\n\n"]
+
+
+def test_stream_ends_after_terminal_event(fake_redis):
+    _, client = fake_redis
+    events = [
+        {"event_id": 1, "status": "IN_TRANSIT", "location": "Pune", "description": None, "created_at": "2026-01-01T01:00:00"},
+        {"event_id": 2, "status": "DELIVERED", "location": "Mumbai", "description": None, "created_at": "2026-01-01T02:00:00"},
+    ]
+
+    async def scenario():
+        shipment, frames = await open_stream(2, "SHIPPED")
+        received = [await frames.__anext__()]
+        for event in events:
+            await client.publish(main.shipment_events_channel(2), orjson.dumps(event))
+        received += await data_frames(frames)
+        return shipment, received
+
+    shipment, frames = asyncio.run(scenario())
+    assert frames == [
+        b"event: shipment\ndata: " + orjson.dumps(shipment) + b"\n\n",
+        b"event: tracking\ndata: " + orjson.dumps(events[0]) + b"\n\n",
+        b"event: tracking\ndata: " + orjson.dumps(events[1]) + b"\n\n",
+    ]
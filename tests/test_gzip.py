@@ -0,0 +1,43 @@
+"""
+Response compression: JSON bodies of 1 KiB or more are gzipped, Server-Sent
+Events streams never are.
+"""
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from test_event_stream import cached_shipment
+from test_list_shipments import shipment_rows
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+def test_large_json_is_gzipped(fake_db):
+    fake_db.rows = shipment_rows(*range(20, 0, -1))
+    with TestClient(main.app) as client:
+        response = client.get("/v1/shipments", headers=GZIP)
+    assert len(response.content) >= 1024
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.json()) == 20
+
+
+def test_small_json_is_not_gzipped(fake_db):
+    fake_db.rows = shipment_rows(1)
+    with TestClient(main.app) as client:
+        response = client.get("/v1/shipments", headers=GZIP)
+    assert len(response.content) < 1024
+    assert "Content-Encoding" not in response.headers
+
+
+def test_event_stream_is_not_gzipped(fake_redis):
+    # Starlette compresses streamed bodies regardless of minimum_size
+    fakeredis = pytest.importorskip("fakeredis")
+    server, _ = fake_redis
+    fakeredis.FakeRedis(server=server).setex("ship:id:1", 30, orjson.dumps(cached_shipment(1, "DELIVERED")))
+    with TestClient(main.app) as client:
+        response = client.get("/v1/shipments/1/events/stream", headers=GZIP)
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/event-stream")
+    assert "Content-Encoding" not in response.headers
+    assert response.content.startswith(b"event: shipment\n")
@@ -0,0 +1,116 @@
+"""
+Idempotency tests. Those marked requires_db run against the PostgreSQL
+database in DATABASE_URL (with db/init.sql loaded) and are skipped when it
+is unreachable.
+"""
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select
+
+import main
+
+
+def run(coro_fn):
+    """Run a coroutine function on a fresh loop, disposing the pool afterwards"""
+    async def wrapper():
+        try:
+            return await coro_fn()
+        finally:
+            await main.engine.dispose()
+    return asyncio.run(wrapper())
+
+
+def database_available() -> bool:
+    async def ping():
+        async with main.SessionLocal() as db:
+            await db.execute(select(1))
+    try:
+        run(ping)
+        return True
+    except Exception:
+        return False
+
+
+requires_db = pytest.mark.skipif(not database_available(), reason="PostgreSQL not reachable via DATABASE_URL")
+
+
+@requires_db
+def test_store_idempotency_rejects_live_key():
+    key = f"test-{uuid.uuid4()}"
+
+    async def scenario():
+        try:
+            async with main.SessionLocal() as db:
+                await main.store_idempotency(db, key, "a" * 64, {"shipment_id": 1})
+                await db.commit()
+
+            async with main.SessionLocal() as db:
+                with pytest.raises(HTTPException) as exc_info:
+                    await main.store_idempotency(db, key, "b" * 64, {"shipment_id": 2})
+                await db.rollback()
+            assert exc_info.value.status_code == 409
+
+            # The first request's record is left untouched
+            async with main.SessionLocal() as db:
+                stored = (await db.execute(
+                    select(main.IdempotencyKey).where(main.IdempotencyKey.key == key)
+                )).scalar_one()
+            assert stored.request_hash == "a" * 64
+        finally:
+            async with main.SessionLocal() as db:
+                await db.execute(delete(main.IdempotencyKey).where(main.IdempotencyKey.key == key))
+                await db.commit()
+
+    run(scenario)
+
+
+@requires_db
+def test_legacy_hashed_key_replays():
+    key = f"test-{uuid.uuid4()}"
+    request_data = main.CreateShipmentRequest(order_id=42, shipping_address={"city": "Pune"}).model_dump()
+    response_data = {"shipment_id": 7, "order_id": 42}
+
+    async def scenario():
+        try:
+            # A row written before request hashes carried a scheme tag
+            async with main.SessionLocal() as db:
+                db.add(main.IdempotencyKey(
+                    key=key,
+                    request_hash=main.compute_legacy_request_hash(request_data),
+                    response_data=main.orjson.dumps(response_data).decode(),
+                    expires_at=main.UTC_NOW + main.timedelta(hours=1)
+                ))
+                await db.commit()
+
+            async with main.SessionLocal() as db:
+                replayed = await main.check_idempotency(
+                    db, key, main.compute_request_hash(request_data), request_data
+                )
+            assert replayed == response_data
+
+            other_data = {**request_data, "order_id": 43}
+            async with main.SessionLocal() as db:
+                with pytest.raises(HTTPException) as exc_info:
+                    await main.check_idempotency(db, key, main.compute_request_hash(other_data), other_data)
+            assert exc_info.value.status_code == 409
+        finally:
+            async with main.SessionLocal() as db:
+                await db.execute(delete(main.IdempotencyKey).where(main.IdempotencyKey.key == key))
+                await db.commit()
+            await main.cache_delete(main.idempotency_cache_key(key))
+
+    run(scenario)
+
+
+def test_unhashable_body_is_rejected():
+    with TestClient(main.app) as client:
+        response = client.post(
+            "/v1/shipments",
+            json={"order_id": 1, "shipping_address": {"pin": 18446744073709551616}},
+            headers={"Idempotency-Key": f"test-{uuid.uuid4()}"}
+        )
+    assert response.status_code == 422
@@ -0,0 +1,58 @@
+"""
+list_shipments pagination headers, with the session stubbed out.
+"""
+from fastapi.testclient import TestClient
+
+import main
+
+
+def shipment_rows(*shipment_ids):
+    return [
+        {
+            "shipment_id": shipment_id,
+            "order_id": 1000 + shipment_id,
+            "carrier": "DHL",
+            "status": "PENDING",
+            "tracking_no": f"TRK{shipment_id:012X}",
+            "shipped_at": None,
+            "delivered_at": None,
+            "created_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-01T00:00:00"
+        }
+        for shipment_id in shipment_ids
+    ]
+
+
+def list_shipments(params):
+    with TestClient(main.app) as client:
+        return client.get("/v1/shipments", params=params)
+
+
+def test_full_page_returns_next_cursor(fake_db):
+    fake_db.rows = shipment_rows(30, 20, 10)
+    response = list_shipments({"limit": 3})
+    assert response.status_code == 200
+    assert [row["shipment_id"] for row in response.json()] == [30, 20, 10]
+    assert response.headers["X-Next-Cursor"] == "10"
+
+
+def test_short_page_has_no_cursor(fake_db):
+    fake_db.rows = shipment_rows(30, 20)
+    response = list_shipments({"limit": 3, "before_id": 40})
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_empty_page_has_no_cursor(fake_db):
+    fake_db.rows = []
+    response = list_shipments({"limit": 3})
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_before_id_seeks_below_the_cursor(fake_db):
+    fake_db.rows = shipment_rows(9)
+    list_shipments({"limit": 3, "before_id": 10})
+    compiled = fake_db.statements[0].compile()
+    assert "shipments.shipment_id < " in str(compiled)
+    assert 10 in compiled.params.values()
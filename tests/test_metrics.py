@@ -0,0 +1,44 @@
+"""
+/metrics render cache tests.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Count renders and control the clock the render cache reads"""
+    calls = []
+    clock = {"now": 1000.0}
+
+    def fake_generate_latest(*args):
+        calls.append(1)
+        return f"render {len(calls)}\n".encode()
+
+    monkeypatch.setattr(main, "PROMETHEUS_MULTIPROC_DIR", None)
+    monkeypatch.setattr(main, "generate_latest", fake_generate_latest)
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setitem(main._metrics_render_cache, "rendered_at", float("-inf"))
+    return calls, clock
+
+
+def test_scrapes_within_ttl_reuse_the_render(renders):
+    calls, clock = renders
+    client = TestClient(main.app)
+    first = client.get("/metrics")
+    clock["now"] += main.METRICS_RENDER_TTL_SECONDS / 2
+    second = client.get("/metrics")
+    assert first.text == second.text == "render 1\n"
+    assert first.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert len(calls) == 1
+
+
+def test_scrape_after_ttl_renders_again(renders):
+    calls, clock = renders
+    client = TestClient(main.app)
+    client.get("/metrics")
+    clock["now"] += main.METRICS_RENDER_TTL_SECONDS + 0.01
+    assert client.get("/metrics").text == "render 2\n"
+    assert len(calls) == 2
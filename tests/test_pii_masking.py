@@ -0,0 +1,60 @@
+"""
+PII masking in log output.
+"""
+import logging
+import sys
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("text, masked", [
+    ("Mail jane.doe+x@example.co.in now", "Mail ***@***.*** now"),
+    ("Call 555-123-4567", "Call ***-***-****"),
+    ("Call 555.123.4567 or 5551234567", "Call ***-***-**** or ***-***-****"),
+    ("Tracking TRK1A2B3C4D5E6F", "Tracking TRK1A2***"),
+    ("jane@example.com shipped TRKABCD to 555-123-4567",
+     "***@***.*** shipped TRKABC*** to ***-***-****"),
+])
+def test_mask_pii(text, masked):
+    assert main.PIIMaskingFormatter.mask_pii(text) == masked
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Shipment created", False),
+    ("Status updated from PENDING to PACKED", False),
+    ("user@example.com", True),
+    ("TRKABCDEF", True),
+    ("order 42", True),
+])
+def test_may_contain_pii(text, expected):
+    assert main._may_contain_pii(text) is expected
+
+
+def format_record(msg, args=(), exc_info=None):
+    formatter = main.PIIMaskingFormatter('%(asctime)s - %(message)s')
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, exc_info)
+    return formatter.format(record)
+
+
+def test_formatter_masks_message_arguments():
+    line = format_record("Notified %s", ("jane@example.com",))
+    assert line.endswith(" - Notified ***@***.***")
+
+
+def test_formatter_skips_masking_for_pii_free_message(monkeypatch):
+    def fail(text):
+        raise AssertionError("mask_pii should not run")
+    monkeypatch.setattr(main.PIIMaskingFormatter, "mask_pii", staticmethod(fail))
+    # The timestamp has digits, but only the message is prefiltered
+    assert format_record("Shipment created").endswith(" - Shipment created")
+
+
+def test_formatter_always_masks_tracebacks():
+    try:
+        raise ValueError("bad address jane@example.com")
+    except ValueError:
+        line = format_record("Shipment failed", exc_info=sys.exc_info())
+    assert "jane@example.com" not in line
+    assert "ValueError: bad address ***@***.***" in line